@@ -11,6 +11,7 @@ from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_ADDRESS, CONF_API_KEY, Platform
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import async_get_loaded_integration
 
 from .const import DOMAIN, LOGGER
@@ -47,6 +48,7 @@ async def async_setup_entry(
         client=WebSocketClient(
             address=entry.data[CONF_ADDRESS],
             apikey=entry.data[CONF_API_KEY],
+            session=async_get_clientsession(hass),
         ),
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
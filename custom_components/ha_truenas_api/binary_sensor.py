@@ -49,34 +49,39 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary_sensor platform."""
     async_add_entities(
-        TrueNasBinarySensor(
-            coordinator=entry.runtime_data.coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description in ENTITY_DESCRIPTIONS
+        [
+            TrueNasBinarySensor(
+                coordinator=entry.runtime_data.coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in ENTITY_DESCRIPTIONS
+        ]
     )
 
 
 class TrueNasBinarySensor(TrueNasEntity, BinarySensorEntity):
     """ha_truenas_api binary_sensor class."""
 
+    __slots__ = ("_path",)
+
     def __init__(
         self,
         coordinator: TrueNasDataUpdateCoordinator,
         entity_description: TrueNasBinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary_sensor class."""
-        super().__init__(entity_description.key, coordinator)
+        super().__init__(
+            entity_description.key,
+            coordinator,
+            frozenset((entity_description.data_key,)),
+        )
         self.entity_description = entity_description
-        self.data_key = entity_description.data_key
-        self.item_key = entity_description.item_key
+        self._path = (entity_description.data_key, entity_description.item_key)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary_sensor is on."""
-        if self.coordinator.data is None:
-            return None
-        data = self.coordinator.data.get(self.data_key)
-        if data is None:
+        try:
+            return self._data[self._path[0]][self._path[1]]
+        except (KeyError, TypeError):
             return None
-        return data.get(self.item_key)
@@ -10,6 +10,20 @@ from slugify import slugify
 
 from .const import DOMAIN
 
+_TEXT_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(
+        type=selector.TextSelectorType.TEXT,
+    ),
+)
+
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): _TEXT_SELECTOR,
+        vol.Required(CONF_ADDRESS): _TEXT_SELECTOR,
+        vol.Required(CONF_API_KEY): _TEXT_SELECTOR,
+    },
+)
+
 
 class TrueNasFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for TrueNas."""
@@ -37,33 +51,6 @@ class TrueNasFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_NAME,
-                        default=(user_input or {}).get(CONF_NAME, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
-                    vol.Required(
-                        CONF_ADDRESS,
-                        default=(user_input or {}).get(CONF_ADDRESS, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
-                    vol.Required(
-                        CONF_API_KEY,
-                        default=(user_input or {}).get(CONF_API_KEY, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
-                },
-            ),
+            data_schema=_USER_SCHEMA,
             errors=_errors,
         )
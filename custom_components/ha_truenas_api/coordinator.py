@@ -5,8 +5,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 if TYPE_CHECKING:
@@ -15,15 +18,69 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .data import TrueNasConfigEntry
+    from .websocket import WebSocketClient
 
 _LOGGER = logging.getLogger(__name__)
 
+_REPORTING_GRAPHS = ("cpu", "cputemp", "memory", "arcsize")
+
+# static request parameters, shared between polls rather than rebuilt each time
+_REPORTING_GRAPH_PARAMS = [{"name": name} for name in _REPORTING_GRAPHS]
+_POOL_QUERY_FIELDS = ("id", "name", "allocated", "free", "size")
+_POOL_QUERY_PARAMS = [[], {"select": list(_POOL_QUERY_FIELDS)}]
+
+# requests that are identical on every poll, keyed by the cache key they fill
+_POLL_JOBS = {
+    "system.info": ("system.info", []),
+    "update.status": ("update.status", []),
+    "pool.query": ("pool.query", _POOL_QUERY_PARAMS),
+    "disk.temperatures": ("disk.temperatures", []),
+}
+
+# ids of the poll requests, whose late replies are dropped rather than cached
+_POLL_KEYS = frozenset((*_POLL_JOBS, "reporting.get_data"))
+
+# the shape each cache entry always has, so readers need not check it
+_DATA_SHAPES: dict[str, type] = {
+    "system.info": dict,
+    "update.status": dict,
+    "pool.query": list,
+    "disk.temperatures": dict,
+    **{f"reporting.graph.{name}": list for name in _REPORTING_GRAPHS},
+}
+
+# list sections that entities pick items from by name, kept indexed by name too
+NAME_INDEXED_SECTIONS = frozenset(
+    ("pool.query", *(f"reporting.graph.{name}" for name in _REPORTING_GRAPHS))
+)
+
+
+def name_index_key(key: str) -> str:
+    """Return the cache key of the by name index of a list section."""
+    return f"{key}:by_name"
+
+
+def _index_by_name(items: list) -> dict[str, Any]:
+    """Index the items of a list section by their name."""
+    # the first item with a name wins, as it does for a scan with find_data_item
+    index: dict[str, Any] = {}
+    for item in items:
+        if isinstance(item, dict) and (name := item.get("name")) is not None:
+            index.setdefault(name, item)
+    return index
+
+
+# collections whose changes are pushed by the server rather than waiting for a poll
+_SUBSCRIPTIONS = ("pool.query",)
+
 
 class TrueNasDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
     config_entry: TrueNasConfigEntry
-    _MAX_LOGIN_RETRIES = 10
+    _client: WebSocketClient
+    _LOGIN_TIMEOUT = 10.0
+    _MAX_CONCURRENT_REQUESTS = 3
 
     def __init__(
         self,
@@ -40,131 +97,169 @@ class TrueNasDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
 
-        self._connection_ok = False
-        self._logged_in = False
+        # set once connected and logged in, cleared on disconnect or auth failure
+        self._ready = asyncio.Event()
         self._data_cache = {}
+        # incremented every time new data is published to listeners
+        self.data_version = 0
+        # cache keys whose values changed in the most recent publish
+        self.changed_keys: frozenset[str] = frozenset()
+        self._pushed_keys: set[str] = set()
         self._pending_requests = {}
+        # limit in-flight requests so slower systems are not flooded
+        self._request_slots = asyncio.Semaphore(self._MAX_CONCURRENT_REQUESTS)
+
+        # coalesce bursts of unsolicited messages into a single listener update
+        self._push_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=1.0,
+            immediate=False,
+            function=self._flush_push,
+        )
+
+        # messages that need handling other than resolving a pending request
+        self._message_dispatch = {
+            "auth.login_with_api_key": self._handle_login,
+            "core.subscribe": self._handle_subscribe,
+        }
 
     async def _async_setup(self) -> None:
         """Set up the WebSocket connection."""
+        self._client = self.config_entry.runtime_data.client
+
         # Register handler for incoming messages
-        self.config_entry.runtime_data.client.add_message_handler(self._handle_message)
-        self.config_entry.runtime_data.client.add_connection_handler(
-            self._handle_connection_change
-        )
+        self._client.add_message_handler(self._handle_message)
+        self._client.add_connection_handler(self._handle_connection_change)
+        self._client.add_event_handler(self._handle_event)
 
-        await self.config_entry.runtime_data.client.connect()
+        await self._client.connect()
 
         _LOGGER.info("WebSocket coordinator setup complete")
 
     async def _async_update_data(self) -> Any:
         """Update data via library."""
         # wait for connection and login to happen before sending commands
-        retry = 0
-        while (
-            not (self._connection_ok and self._logged_in)
-            and retry < self._MAX_LOGIN_RETRIES
-        ):
-            retry += 1
-            await asyncio.sleep(1)
-
-        if not (self._connection_ok and self._logged_in):
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=self._LOGIN_TIMEOUT)
+        except TimeoutError as exception:
             msg = "Connection or login to server failed"
-            raise TimeoutError(msg)
-
-        _LOGGER.debug("Requesting data from websocket")
-        start_time = end_time = int(time.time() - 5.0)
+            raise UpdateFailed(msg) from exception
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Requesting data from websocket")
+        # a single data point from just before now, the rest of the jobs are static
+        timestamp = int(time.time() - 5.0)
+        jobs = {
+            **_POLL_JOBS,
+            # fetch every graph in one round-trip rather than one per graph
+            "reporting.get_data": (
+                "reporting.get_data",
+                [_REPORTING_GRAPH_PARAMS, {"start": timestamp, "end": timestamp}],
+            ),
+        }
+
+        # rather than calling these individually, do them all at once
+        tasks: dict[str, asyncio.Task] = {}
         try:
-            jobs = {
-                "system.info": ("system.info", []),
-                "update.status": ("update.status", []),
-                "reporting.graph.cpu": (
-                    "reporting.graph",
-                    [
-                        "cpu",
-                        {
-                            "start": start_time,
-                            "end": end_time,
-                        },
-                    ],
-                ),
-                "reporting.graph.cputemp": (
-                    "reporting.graph",
-                    [
-                        "cputemp",
-                        {
-                            "start": start_time,
-                            "end": end_time,
-                        },
-                    ],
-                ),
-                "pool.query": (
-                    "pool.query",
-                    [[], {"select": ["name", "allocated", "free", "size"]}],
-                ),
-                "disk.temperatures": ("disk.temperatures", []),
-                "reporting.graph.memory": (
-                    "reporting.graph",
-                    [
-                        "memory",
-                        {
-                            "start": start_time,
-                            "end": end_time,
-                        },
-                    ],
-                ),
-                "reporting.graph.arcsize": (
-                    "reporting.graph",
-                    [
-                        "arcsize",
-                        {
-                            "start": start_time,
-                            "end": end_time,
-                        },
-                    ],
-                ),
-            }
-
-            # rather than calling these individually, do them all at once
-            for job_key, (method, params) in jobs.items():
-                future = asyncio.Future()
-                self._pending_requests[job_key] = future
-                await self.config_entry.runtime_data.client.send_message(
-                    job_key, method, params
-                )
-
-            try:
-                keys = list(self._pending_requests.keys())
-
-                results = await asyncio.wait_for(
-                    asyncio.gather(
-                        *list(self._pending_requests.values()),
-                        return_exceptions=True,
-                    ),
-                    timeout=10.0,  # 10 second timeout for all polls
-                )
-
-                # Update cache with results
-                for index, job_key in enumerate(keys):
-                    if not isinstance(results[index], Exception):
-                        _LOGGER.debug("Updating cache for %s", job_key)
-                        self._data_cache[job_key] = results[index]
-                    else:
-                        _LOGGER.error("Failed to get %s: %s", job_key, results[index])
-
-            except TimeoutError:
-                _LOGGER.warning("Timeout waiting for responses from TrueNAS")
-                # Clean up pending requests
-                for future in self._pending_requests.values():
-                    future.cancel()
-                self._pending_requests.clear()
-                self._data_cache = {}
+            async with (
+                asyncio.timeout(10.0),  # 10 second timeout for all polls
+                asyncio.TaskGroup() as tg,
+            ):
+                for job_key, (method, params) in jobs.items():
+                    tasks[job_key] = tg.create_task(
+                        self._call_job(job_key, method, params)
+                    )
+        except TimeoutError:
+            # keep the previously cached values for anything that timed out
+            _LOGGER.warning(
+                "Timeout waiting for responses from TrueNAS: %s",
+                ", ".join(key for key, task in tasks.items() if task.cancelled()),
+            )
+
+        # Collect results, then swap in a new dict so that snapshots already
+        # handed to listeners are never modified
+        updates: dict[str, Any] = {}
+        errors: list[str] = []
+        for job_key, task in tasks.items():
+            if not task.done() or task.cancelled():
+                errors.append(f"{job_key}: timed out")
+                continue
+            if isinstance(result := task.result(), Exception):
+                _LOGGER.error("Failed to get %s: %s", job_key, result)
+                errors.append(f"{job_key}: {result}")
+                continue
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Updating cache for %s", job_key)
+            if job_key == "reporting.get_data":
+                updates.update(self._split_graphs(result))
+            elif isinstance(result, _DATA_SHAPES[job_key]):
+                updates[job_key] = result
+            else:
+                _LOGGER.warning("Unexpected %s data: %s", job_key, result)
+                updates[job_key] = _DATA_SHAPES[job_key]()
+
+        # a partial failure keeps the cached values, but with nothing at all the
+        # server is unreachable, so let the entities go unavailable
+        if len(errors) == len(tasks):
+            msg = f"No data from TrueNAS: {'; '.join(errors)}"
+            raise UpdateFailed(msg)
+
+        # anything never fetched gets an empty value rather than being missing
+        for key, shape in _DATA_SHAPES.items():
+            if key not in updates and key not in self._data_cache:
+                updates[key] = shape()
+
+        # rebuild the indexes of anything updated so lookups by name avoid a scan
+        for key in NAME_INDEXED_SECTIONS.intersection(updates):
+            updates[name_index_key(key)] = _index_by_name(updates[key])
+
+        # nothing changed, so keep publishing the previous snapshot
+        self.changed_keys = frozenset(
+            key for key, value in updates.items() if self._data_cache.get(key) != value
+        )
+        if self.changed_keys:
+            self._data_cache = {**self._data_cache, **updates}
+            self.data_version += 1
 
-        except Exception as exception:
-            _LOGGER.exception("Error during update")
-            raise UpdateFailed(exception) from exception
+        return MappingProxyType(self._data_cache)
 
-        return self._data_cache
+    async def _call(self, msg_id: str, method: str, params: list) -> Any:
+        """Send a request and wait for the matching response."""
+        async with self._request_slots:
+            future = self.hass.loop.create_future()
+            self._pending_requests[msg_id] = future
+            try:
+                await self._client.send_message(msg_id, method, params)
+                return await future
+            finally:
+                self._pending_requests.pop(msg_id, None)
+
+    async def _call_job(self, msg_id: str, method: str, params: list) -> Any:
+        """
+        Make a poll request, returning any error rather than raising it.
+
+        A raised error would make the task group cancel the other requests, so
+        one failing endpoint would stop the rest from ever updating.
+        """
+        try:
+            return await self._call(msg_id, method, params)
+        except Exception as err:  # noqa: BLE001 Do not catch blind exception: `Exception`
+            return err
+
+    def _split_graphs(self, data: Any) -> dict[str, list]:
+        """Split a reporting.get_data result into per-graph cache entries."""
+        graphs: dict[str, list] = {
+            f"reporting.graph.{name}": [] for name in _REPORTING_GRAPHS
+        }
+        if isinstance(data, list):
+            for item in data:
+                if isinstance(item, dict):
+                    graphs.setdefault(f"reporting.graph.{item.get('name')}", []).append(
+                        item
+                    )
+        return graphs
 
     async def _handle_connection_change(
         self,
@@ -172,19 +267,15 @@ class TrueNasDataUpdateCoordinator(DataUpdateCoordinator):
         error: str | None,
     ) -> None:
         """Handle WebSocket connection state changes."""
-        self._connection_ok = is_connected
+        self._ready.clear()
 
         if is_connected:
             _LOGGER.info("WebSocket connected")
             try:
-                await self.config_entry.runtime_data.client.send_login(
-                    "auth.login_with_api_key"
-                )
+                await self._client.send_login("auth.login_with_api_key")
             except Exception:
-                self._logged_in = False
                 _LOGGER.exception("failed to send login")
         else:
-            self._logged_in = False
             _LOGGER.warning("WebSocket disconnected: %s", error)
 
     async def _handle_message(
@@ -194,38 +285,127 @@ class TrueNasDataUpdateCoordinator(DataUpdateCoordinator):
         is_error: bool,
     ) -> None:
         """Handle incoming WebSocket message."""
-        # Update coordinator data
-        if msg_id == "auth.login_with_api_key":
-            if is_error:
-                self._logged_in = False
-                _LOGGER.warning("Failed to authenticate")
-            else:
-                self._logged_in = True
-                _LOGGER.info("Authentication successful")
-            return
+        handler = self._message_dispatch.get(msg_id, self._handle_response)
+        handler(msg_id, data, is_error)
+
+    def _handle_login(
+        self,
+        msg_id: int | str,  # noqa: ARG002 Unused method argument: `msg_id`
+        data: dict,  # noqa: ARG002 Unused method argument: `data`
+        is_error: bool,
+    ) -> None:
+        """Handle the response to a login request."""
+        if is_error:
+            self._ready.clear()
+            _LOGGER.warning("Failed to authenticate")
+        else:
+            self._ready.set()
+            _LOGGER.info("Authentication successful")
+            # tracked by the entry so it is cancelled if the entry unloads
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_subscribe(), "truenas event subscription"
+            )
+
+    async def _async_subscribe(self) -> None:
+        """Subscribe to server side events for collections we cache."""
+        for collection in _SUBSCRIPTIONS:
+            try:
+                await self._client.send_message(
+                    "core.subscribe", "core.subscribe", [collection]
+                )
+            except Exception:
+                _LOGGER.exception("failed to subscribe to %s", collection)
+
+    def _handle_subscribe(
+        self,
+        msg_id: int | str,  # noqa: ARG002 Unused method argument: `msg_id`
+        data: dict,
+        is_error: bool,
+    ) -> None:
+        """Handle the response to a subscription request."""
+        if is_error:
+            _LOGGER.warning("Failed to subscribe to events: %s", data)
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Subscribed to events: %s", data)
+
+    def _handle_response(
+        self,
+        msg_id: int | str,
+        data: dict,
+        is_error: bool,
+    ) -> None:
+        """Resolve a pending request, or cache an unsolicited message."""
+        future = self._pending_requests.pop(msg_id, None)
 
         if is_error:
             _LOGGER.error("error returned from request: %s error: %s", msg_id, data)
-            if msg_id in self._pending_requests:
-                future = self._pending_requests.pop(msg_id)
-                if not future.done():
-                    future.set_exception(Exception(f"TrueNAS error: {data}"))
+            if future is not None and not future.done():
+                future.set_exception(Exception(f"TrueNAS error: {data}"))
             return
 
-        _LOGGER.debug("Got %s data from websocket", msg_id)
-        if msg_id in self._pending_requests:
-            future = self._pending_requests.pop(msg_id)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Got %s data from websocket", msg_id)
+        if future is not None:
             if not future.done():
                 future.set_result(data)
+        elif msg_id in _POLL_KEYS:
+            # the poll gave up on this one, caching it here would skip the shape
+            # checks and indexes, and the next poll fetches it again anyway
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Dropping late reply for %s", msg_id)
         else:
-            # Unsolicited message
-            self._data_cache[msg_id] = data
-            self.async_set_updated_data(self._data_cache)
+            # Unsolicited message, copy on write so published snapshots never change
+            self._data_cache = {**self._data_cache, msg_id: data}
+            self._pushed_keys.add(msg_id)
+            self._push_debouncer.async_schedule_call()
+
+    async def _handle_event(self, method: str, params: dict | None) -> None:
+        """Handle a subscribed event pushed by the server."""
+        if method != "collection_update" or not isinstance(params, dict):
+            return
+        if params.get("collection") != "pool.query":
+            return
+
+        pools = self._data_cache.get("pool.query")
+        if params.get("msg") != "changed" or not isinstance(pools, list):
+            # pools added or removed, fetch the full list again; scheduled rather
+            # than awaited as the refresh needs this listener to read responses
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_request_refresh(), "truenas pool refresh"
+            )
+            return
+
+        fields = params.get("fields") or {}
+        changes = {key: fields[key] for key in _POOL_QUERY_FIELDS if key in fields}
+        pools = [
+            {**pool, **changes} if pool.get("id") == params.get("id") else pool
+            for pool in pools
+        ]
+        # copy on write so published snapshots never change
+        self._data_cache = {
+            **self._data_cache,
+            "pool.query": pools,
+            name_index_key("pool.query"): _index_by_name(pools),
+        }
+        self._pushed_keys.add("pool.query")
+        self._push_debouncer.async_schedule_call()
+
+    @callback
+    def _flush_push(self) -> None:
+        """Publish cached data after unsolicited messages have been received."""
+        self.data_version += 1
+        self.changed_keys = frozenset(self._pushed_keys)
+        self._pushed_keys.clear()
+        # publish without async_set_updated_data, which would also push back the
+        # next scheduled poll of everything that is not pushed
+        self.data = MappingProxyType(self._data_cache)
+        self.async_update_listeners()
 
     async def async_force_reconnect(self) -> None:
         """Manually trigger reconnection."""
-        await self.config_entry.runtime_data.client.force_reconnect()
+        await self._client.force_reconnect()
 
     async def async_shutdown(self) -> None:
         """Clean shutdown of WebSocket."""
-        await self.config_entry.runtime_data.client.close()
+        self._push_debouncer.async_shutdown()
+        await self._client.close()
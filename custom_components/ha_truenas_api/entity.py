@@ -2,29 +2,54 @@
 
 from __future__ import annotations
 
-from typing import Any
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import TrueNasDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
 
-def property_from_path(data: dict[str, Any] | None, path: str) -> Any | None:
+
+def property_from_path(
+    data: dict[str, Any] | None, parts: tuple[str, ...]
+) -> Any | None:
     """Navigate to a property given a set of keys to traverse."""
-    parts = path.split(":")
+    try:
+        for part in parts:
+            data = data[part]
+    except (KeyError, TypeError):
+        return None
+    return data
+
+
+def path_getter(parts: tuple[str, ...]) -> Callable[[Any], Any | None]:
+    """Build a function that navigates to the property at a fixed path."""
+    if not parts:
+        return lambda data: data
+
+    if len(parts) != 1:
+        return lambda data: property_from_path(data, parts)
+
+    # most paths are a single key, so skip the loop entirely for those
+    get_item = itemgetter(parts[0])
 
-    this_data = data
-    for part in parts:
-        if this_data is None:
+    def get_single(data: Any) -> Any | None:
+        try:
+            return get_item(data)
+        except (KeyError, TypeError):
             return None
-        this_data = this_data.get(part)
-    return this_data
+
+    return get_single
 
 
 def find_data_item(
     data: Any,
-    match: dict[str, Any] | None = None,
+    match: Mapping[str, Any] | None = None,
 ) -> Any:
     """
     Find an item in data using a dict containing the key/value pairs to match.
@@ -54,11 +79,29 @@ def find_data_item(
 class TrueNasEntity(CoordinatorEntity[TrueNasDataUpdateCoordinator]):
     """TrueNasEntity class."""
 
+    __slots__ = ("_data", "_data_keys", "_written_available")
+
     def __init__(
-        self, unique_id: str, coordinator: TrueNasDataUpdateCoordinator
+        self,
+        unique_id: str,
+        coordinator: TrueNasDataUpdateCoordinator,
+        data_keys: frozenset[str] | None = None,
     ) -> None:
-        """Initialize."""
+        """
+        Initialize.
+
+        Args:
+            unique_id: The unique id of the entity.
+            coordinator: The coordinator providing the data.
+            data_keys: The coordinator data keys the entity state is derived from,
+                or None to write state on every coordinator update.
+
+        """
         super().__init__(coordinator)
+        # the published data, refreshed on each update rather than read per property
+        self._data = coordinator.data
+        self._data_keys = data_keys
+        self._written_available = False
         self._attr_unique_id = unique_id
         self._attr_has_entity_name = True
         self._attr_device_info = DeviceInfo(
@@ -69,3 +112,22 @@ class TrueNasEntity(CoordinatorEntity[TrueNasDataUpdateCoordinator]):
                 ),
             },
         )
+
+    async def async_added_to_hass(self) -> None:
+        """Pick up any data published between construction and being added."""
+        self._data = self.coordinator.data
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the data this entity reads has changed."""
+        self._data = self.coordinator.data
+        if (
+            self._data_keys is not None
+            and self._written_available
+            and self.coordinator.last_update_success
+            and self._data_keys.isdisjoint(self.coordinator.changed_keys)
+        ):
+            return
+        self._written_available = self.coordinator.last_update_success
+        super()._handle_coordinator_update()
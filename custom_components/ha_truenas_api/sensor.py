@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
@@ -19,10 +21,16 @@ from homeassistant.const import (
     UnitOfTime,
 )
 
-from .entity import TrueNasEntity, find_data_item, property_from_path
+from .coordinator import NAME_INDEXED_SECTIONS, name_index_key
+from .entity import (
+    TrueNasEntity,
+    find_data_item,
+    path_getter,
+    property_from_path,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -36,41 +44,38 @@ class TrueNasSensorEntityDescription(SensorEntityDescription):
     """Describes TrueNAs sensor entities."""
 
     data_key: str
-    data_match: dict[str, Any] | None = None
-    item_key: str
+    data_match: Mapping[str, Any] | None = None
+    item_key: str = ""
+    item_path: tuple[str, ...] = ()
     item_index: int | None = None
     value_fn: Callable[[TrueNasSensor, Any], Any] | None = None
 
+    def __post_init__(self) -> None:
+        """Split the item key once rather than on every state read."""
+        # an explicit path is used as given, otherwise it comes from the item key
+        # with neither, the value is the whole matched item
+        parts = self.item_path or (self.item_key.split(":") if self.item_key else ())
+        object.__setattr__(self, "item_path", tuple(parts))
 
-def calc_percentage(
-    sensor: TrueNasSensor,
-    numerator: Any,
-    section: str,
-    match: dict[str, Any] | None,
-    item_key: str,
-    item_index: int | None,
-) -> float | None:
-    """Calculate a percentage from two items in the data."""
-    try:
-        denominator = sensor.find_value(section, match, item_key, item_index)
-        if denominator is None:
-            return None
-        return (float(numerator) / float(denominator)) * 100.0
-    except (TypeError, ValueError, ZeroDivisionError):
-        return None
+
+# many descriptions match on the same names, so they share one read-only match
+@lru_cache(maxsize=128)
+def _match_by_name(name: str) -> Mapping[str, Any]:
+    """Return the match criteria selecting an item by name."""
+    return MappingProxyType({"name": name})
 
 
 def calc_remaining_percentage(
     sensor: TrueNasSensor,
     numerator: Any,
     section: str,
-    match: dict[str, Any] | None,
-    item_key: str,
+    match: Mapping[str, Any] | None,
+    item_path: tuple[str, ...],
     item_index: int | None,
 ) -> float | None:
     """Calculate a remaining percentage from two items in the data."""
     try:
-        denominator = sensor.find_value(section, match, item_key, item_index)
+        denominator = sensor.find_value(section, match, item_path, item_index)
         if denominator is None:
             return None
         return (1.0 - float(numerator) / float(denominator)) * 100.0
@@ -78,6 +83,17 @@ def calc_remaining_percentage(
         return None
 
 
+def _pool_usage(
+    sensor: TrueNasSensor,  # noqa: ARG001 Unused function argument: `sensor`
+    pool: Any,
+) -> float | None:
+    """Calculate the allocated percentage of a pool from its own size."""
+    try:
+        return (float(pool["allocated"]) / float(pool["size"])) * 100.0
+    except (KeyError, TypeError, ValueError, ZeroDivisionError):
+        return None
+
+
 ENTITY_DESCRIPTIONS = (
     TrueNasSensorEntityDescription(
         key="truenas_version",
@@ -167,7 +183,7 @@ ENTITY_DESCRIPTIONS = (
         suggested_display_precision=2,
         suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
         data_key="reporting.graph.memory",
-        data_match={"name": "memory"},
+        data_match=_match_by_name("memory"),
         item_key="aggregations:mean:available",
     ),
     TrueNasSensorEntityDescription(
@@ -177,14 +193,14 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=0,
         data_key="reporting.graph.memory",
-        data_match={"name": "memory"},
+        data_match=_match_by_name("memory"),
         item_key="aggregations:mean:available",
         value_fn=lambda sensor, value: calc_remaining_percentage(
             sensor,
             value,
             "system.info",
             None,
-            "physmem",
+            ("physmem",),
             None,
         ),
     ),
@@ -198,12 +214,111 @@ ENTITY_DESCRIPTIONS = (
         suggested_display_precision=2,
         suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
         data_key="reporting.graph.arcsize",
-        data_match={"name": "arcsize"},
+        data_match=_match_by_name("arcsize"),
         item_key="aggregations:mean:size",
     ),
 )
 
 
+# the sensors created for every pool: key part, name suffix and description fields
+_POOL_SIZE_FIELDS: dict[str, Any] = {
+    "icon": "mdi:harddisk",
+    "device_class": SensorDeviceClass.DATA_SIZE,
+    "native_unit_of_measurement": UnitOfInformation.BYTES,
+    "suggested_display_precision": 2,
+    "suggested_unit_of_measurement": UnitOfInformation.GIGABYTES,
+}
+_POOL_SENSORS: tuple[tuple[str, str, dict[str, Any]], ...] = (
+    ("free", "Pool Free Space", {**_POOL_SIZE_FIELDS, "item_key": "free"}),
+    (
+        "allocated",
+        "Pool Allocated Space",
+        {**_POOL_SIZE_FIELDS, "item_key": "allocated"},
+    ),
+    ("size", "Pool Size", {**_POOL_SIZE_FIELDS, "item_key": "size"}),
+    (
+        "usage",
+        "Pool Usage",
+        {
+            "icon": "mdi:harddisk",
+            "native_unit_of_measurement": PERCENTAGE,
+            "suggested_display_precision": 0,
+            # no item path, so the value is the pool itself
+            "value_fn": _pool_usage,
+        },
+    ),
+)
+
+
+# where the reporting graphs keep the single data point we request
+_MEAN_PATH = ("aggregations", "mean")
+
+
+# the fixed fields of the sensors created for each reported cpu key or disk
+_CPU_USAGE_TEMPLATE = TrueNasSensorEntityDescription(
+    key="truenas_usage",
+    icon="mdi:cpu-64-bit",
+    native_unit_of_measurement=PERCENTAGE,
+    suggested_display_precision=0,
+    data_key="reporting.graph.cpu",
+    data_match=_match_by_name("cpu"),
+)
+_CPU_TEMPERATURE_TEMPLATE = TrueNasSensorEntityDescription(
+    key="truenas_temperature",
+    icon="mdi:thermometer",
+    device_class=SensorDeviceClass.TEMPERATURE,
+    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    state_class=SensorStateClass.MEASUREMENT,
+    suggested_display_precision=0,
+    data_key="reporting.graph.cputemp",
+    data_match=_match_by_name("cputemp"),
+)
+_DISK_TEMPERATURE_TEMPLATE = TrueNasSensorEntityDescription(
+    key="truenas_disk_temperature",
+    icon="mdi:thermometer",
+    device_class=SensorDeviceClass.TEMPERATURE,
+    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    state_class=SensorStateClass.MEASUREMENT,
+    suggested_display_precision=0,
+    data_key="disk.temperatures",
+)
+
+
+# the reported cpu keys are stable for a host, so reloads can reuse the descriptions
+@lru_cache(maxsize=8)
+def _cpu_usage_descriptions(
+    keys: tuple[str, ...],
+) -> tuple[TrueNasSensorEntityDescription, ...]:
+    """Build the usage sensor descriptions for the reported cpu keys."""
+    return tuple(
+        replace(
+            _CPU_USAGE_TEMPLATE,
+            key=f"truenas_usage_{key}",
+            name=f"{key.upper()} Usage",
+            # should be largely irrelevant which I use, as its a single data point
+            item_path=(*_MEAN_PATH, key),
+        )
+        for key in keys
+    )
+
+
+@lru_cache(maxsize=8)
+def _cpu_temperature_descriptions(
+    keys: tuple[str, ...],
+) -> tuple[TrueNasSensorEntityDescription, ...]:
+    """Build the temperature sensor descriptions for the reported cpu keys."""
+    return tuple(
+        replace(
+            _CPU_TEMPERATURE_TEMPLATE,
+            key=f"truenas_temperature_{key}",
+            name=f"{key.upper()} Temperature",
+            # should be largely irrelevant which I use, as its a single data point
+            item_path=(*_MEAN_PATH, key),
+        )
+        for key in keys
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
     entry: TrueNasConfigEntry,
@@ -212,215 +327,164 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     coordinator = entry.runtime_data.coordinator
 
-    await coordinator.async_config_entry_first_refresh()
-
-    entities = []
-
-    entities.extend(
-        TrueNasSensor(
-            coordinator=coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description in ENTITY_DESCRIPTIONS
-    )
+    # the entry setup has normally fetched the data already
+    if coordinator.data is None:
+        await coordinator.async_config_entry_first_refresh()
 
     # dynamically work out what cpu data is available
-    cpu_data = coordinator.data.get("reporting.graph.cpu")
-    if isinstance(cpu_data, list) and cpu_data:
-        mean_map = property_from_path(cpu_data[0], "aggregations:mean")
-
+    cpu_descriptions: tuple[TrueNasSensorEntityDescription, ...] = ()
+    if cpu_data := coordinator.data["reporting.graph.cpu"]:
+        mean_map = property_from_path(cpu_data[0], _MEAN_PATH)
         if isinstance(mean_map, dict):
-            entities.extend(
-                TrueNasSensor(
-                    coordinator=coordinator,
-                    entity_description=TrueNasSensorEntityDescription(
-                        key=f"truenas_usage_{key}",
-                        name=f"{key.upper()} Usage",
-                        icon="mdi:cpu-64-bit",
-                        native_unit_of_measurement=PERCENTAGE,
-                        suggested_display_precision=0,
-                        data_key="reporting.graph.cpu",
-                        data_match={"name": "cpu"},
-                        # should be largely irrelevant which I use, as its a single data point
-                        item_key=f"aggregations:mean:{key}",
-                    ),
-                )
-                for key in mean_map
-            )
+            cpu_descriptions = _cpu_usage_descriptions(tuple(mean_map))
 
     # dynamically work out what temperature data is available
-    cputemp_data = coordinator.data.get("reporting.graph.cputemp")
-    if isinstance(cputemp_data, list) and cputemp_data:
-        mean_map = property_from_path(cputemp_data[0], "aggregations:mean")
-
+    cputemp_descriptions: tuple[TrueNasSensorEntityDescription, ...] = ()
+    if cputemp_data := coordinator.data["reporting.graph.cputemp"]:
+        mean_map = property_from_path(cputemp_data[0], _MEAN_PATH)
         if isinstance(mean_map, dict):
-            entities.extend(
-                TrueNasSensor(
-                    coordinator=coordinator,
-                    entity_description=TrueNasSensorEntityDescription(
-                        key=f"truenas_temperature_{key}",
-                        name=f"{key.upper()} Temperature",
-                        icon="mdi:thermometer",
-                        device_class=SensorDeviceClass.TEMPERATURE,
-                        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                        state_class=SensorStateClass.MEASUREMENT,
-                        suggested_display_precision=0,
-                        data_key="reporting.graph.cputemp",
-                        data_match={"name": "cputemp"},
-                        # should be largely irrelevant which I use, as its a single data point
-                        item_key=f"aggregations:mean:{key}",
-                    ),
-                )
-                for key in mean_map
-            )
+            cputemp_descriptions = _cpu_temperature_descriptions(tuple(mean_map))
 
     # dynamically work out what pool data is available
-    pool_data = coordinator.data.get("pool.query")
-    if isinstance(pool_data, list):
-        for pool in pool_data:
-            pool_name = pool.get("name")
-            if not pool_name:
-                continue
-            entities.extend(
-                [
-                    TrueNasSensor(
-                        coordinator=coordinator,
-                        entity_description=TrueNasSensorEntityDescription(
-                            key=f"truenas_pool_free_{pool_name}",
-                            name=f"{pool_name} Pool Free Space",
-                            icon="mdi:harddisk",
-                            device_class=SensorDeviceClass.DATA_SIZE,
-                            native_unit_of_measurement=UnitOfInformation.BYTES,
-                            suggested_display_precision=2,
-                            suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
-                            data_key="pool.query",
-                            data_match={"name": pool_name},
-                            item_key="free",
-                        ),
-                    ),
-                    TrueNasSensor(
-                        coordinator=coordinator,
-                        entity_description=TrueNasSensorEntityDescription(
-                            key=f"truenas_pool_allocated_{pool_name}",
-                            name=f"{pool_name} Pool Allocated Space",
-                            icon="mdi:harddisk",
-                            device_class=SensorDeviceClass.DATA_SIZE,
-                            native_unit_of_measurement=UnitOfInformation.BYTES,
-                            suggested_display_precision=2,
-                            suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
-                            data_key="pool.query",
-                            data_match={"name": pool_name},
-                            item_key="allocated",
-                        ),
-                    ),
-                    TrueNasSensor(
-                        coordinator=coordinator,
-                        entity_description=TrueNasSensorEntityDescription(
-                            key=f"truenas_pool_size_{pool_name}",
-                            name=f"{pool_name} Pool Size",
-                            icon="mdi:harddisk",
-                            device_class=SensorDeviceClass.DATA_SIZE,
-                            native_unit_of_measurement=UnitOfInformation.BYTES,
-                            suggested_display_precision=2,
-                            suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
-                            data_key="pool.query",
-                            data_match={"name": pool_name},
-                            item_key="size",
-                        ),
-                    ),
-                    TrueNasSensor(
-                        coordinator=coordinator,
-                        entity_description=TrueNasSensorEntityDescription(
-                            key=f"truenas_pool_usage_{pool_name}",
-                            name=f"{pool_name} Pool Usage",
-                            icon="mdi:harddisk",
-                            native_unit_of_measurement=PERCENTAGE,
-                            suggested_display_precision=0,
-                            data_key="pool.query",
-                            data_match={"name": pool_name},
-                            item_key="allocated",
-                            value_fn=lambda sensor, value: calc_percentage(
-                                sensor,
-                                value,
-                                sensor.data_key,
-                                sensor.data_match,
-                                "size",
-                                None,
-                            ),
-                        ),
-                    ),
-                ]
-            )
+    pool_descriptions = [
+        TrueNasSensorEntityDescription(
+            key=f"truenas_pool_{kind}_{pool_name}",
+            name=f"{pool_name} {name}",
+            data_key="pool.query",
+            data_match=_match_by_name(pool_name),
+            **fields,
+        )
+        for pool in coordinator.data["pool.query"]
+        if (pool_name := pool.get("name"))
+        for kind, name, fields in _POOL_SENSORS
+    ]
 
     # dynamically work out what temperature data is available
-    disktemp_data = coordinator.data.get("disk.temperatures")
-    if isinstance(disktemp_data, dict):
-        entities.extend(
+    disktemp_descriptions = [
+        replace(
+            _DISK_TEMPERATURE_TEMPLATE,
+            key=f"truenas_disk_temperature_{key}",
+            name=f"{key} Disk Temperature",
+            item_key=key,
+        )
+        for key in coordinator.data["disk.temperatures"]
+    ]
+
+    # build every entity in one pass now the total is known
+    async_add_entities(
+        [
             TrueNasSensor(
                 coordinator=coordinator,
-                entity_description=TrueNasSensorEntityDescription(
-                    key=f"truenas_disk_temperature_{key}",
-                    name=f"{key} Disk Temperature",
-                    icon="mdi:thermometer",
-                    device_class=SensorDeviceClass.TEMPERATURE,
-                    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                    data_key="disk.temperatures",
-                    item_key=key,
-                ),
+                entity_description=entity_description,
             )
-            for key in disktemp_data
-        )
+            for entity_description in (
+                *ENTITY_DESCRIPTIONS,
+                *cpu_descriptions,
+                *cputemp_descriptions,
+                *pool_descriptions,
+                *disktemp_descriptions,
+            )
+        ]
+    )
+
+
+def _build_resolver(
+    description: TrueNasSensorEntityDescription,
+) -> Callable[[Any], Any]:
+    """Build a function that reads a description's value from coordinator data."""
+    data_key = description.data_key
+    match = description.data_match
+    get_path = path_getter(description.item_path)
+    if (item_index := description.item_index) is None:
+        get_item = get_path
+    else:
+
+        def get_item(section: Any) -> Any:
+            value = get_path(section)
+            return value[item_index] if isinstance(value, list) else value
 
-    async_add_entities(entities)
+    if match is None:
+        return lambda data: get_item(data[data_key])
+    if data_key in NAME_INDEXED_SECTIONS and match.keys() == {"name"}:
+        # a missing name raises KeyError, which reads as no value
+        index_key = name_index_key(data_key)
+        name = match["name"]
+        return lambda data: get_item(data[index_key][name])
+    return lambda data: get_item(find_data_item(data[data_key], match))
 
 
 class TrueNasSensor(TrueNasEntity, SensorEntity):
     """ha_truenas_api Sensor class."""
 
+    __slots__ = ("_cached_value", "_cached_version", "_resolve")
+
+    entity_description: TrueNasSensorEntityDescription
+
     def __init__(
         self,
         coordinator: TrueNasDataUpdateCoordinator,
         entity_description: TrueNasSensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(entity_description.key, coordinator)
+        # value_fn may read other sections, so those sensors update every time
+        super().__init__(
+            entity_description.key,
+            coordinator,
+            None
+            if entity_description.value_fn
+            else frozenset((entity_description.data_key,)),
+        )
         self.entity_description = entity_description
-        self.data_key = entity_description.data_key
-        self.data_match = entity_description.data_match
-        self.item_key = entity_description.item_key
-        self.item_index = entity_description.item_index
-        self.value_fn = entity_description.value_fn
+        self._cached_version = -1
+        self._cached_value: str | int | float | None = None
+        # everything a read needs is fixed, so resolve it to one function up front
+        self._resolve = _build_resolver(entity_description)
 
     @property
     def native_value(self) -> str | int | float | None:
         """Return the native value of the sensor."""
-        value = self.find_value(
-            self.data_key, self.data_match, self.item_key, self.item_index
-        )
-
-        if value is not None and self.value_fn:
-            return self.value_fn(self, value)
-
+        coordinator = self.coordinator
+        # data only changes when the coordinator publishes, so reuse the last result
+        if self._cached_version == coordinator.data_version:
+            return self._cached_value
+
+        description = self.entity_description
+        # the data is almost always present, so let a missing piece raise once
+        try:
+            value = self._resolve(self._data)
+        except (KeyError, IndexError, TypeError):
+            value = None
+
+        if value is not None and description.value_fn:
+            value = description.value_fn(self, value)
+
+        self._cached_version = coordinator.data_version
+        self._cached_value = value
         return value
 
     def find_value(
         self,
         section: str,
-        match: dict[str, Any] | None,
-        item_key: str,
+        match: Mapping[str, Any] | None,
+        item_path: tuple[str, ...],
         item_index: int | None,
     ) -> str | int | float | None:
         """Find a matching value from criteria or return None."""
-        if self.coordinator.data is None:
+        if self._data is None:
             return None
 
-        data = self.coordinator.data.get(section)
-        if match is not None:
-            data = find_data_item(data, match)
-
-        value = property_from_path(data, item_key)
+        if (
+            match is not None
+            and section in NAME_INDEXED_SECTIONS
+            and match.keys() == {"name"}
+        ):
+            data = self._data[name_index_key(section)].get(match["name"])
+        else:
+            data = self._data.get(section)
+            if match is not None:
+                data = find_data_item(data, match)
+
+        value = property_from_path(data, item_path)
         if item_index is not None and isinstance(value, list):
             value = value[item_index]
 
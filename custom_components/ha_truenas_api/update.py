@@ -20,6 +20,13 @@ if TYPE_CHECKING:
     from .data import TrueNasConfigEntry
 
 
+# fixed locations in the coordinator data, built once rather than per property read
+_INSTALLED_VERSION_PATH = ("system.info", "version")
+_LATEST_VERSION_PATH = ("update.status", "status", "new_version", "version")
+_RELEASE_URL_PATH = ("update.status", "status", "new_version", "release_notes_url")
+_PROGRESS_PATH = ("update.status", "update_download_progress")
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
     entry: TrueNasConfigEntry,
@@ -45,70 +52,58 @@ async def async_setup_entry(
 class TrueNasUpdateEntity(TrueNasEntity, UpdateEntity):
     """ha_truenas_api update class."""
 
+    __slots__ = ("_progress", "_progress_version")
+
     def __init__(
         self,
         coordinator: TrueNasDataUpdateCoordinator,
         entity_description: UpdateEntityDescription,
     ) -> None:
         """Initialize the update class."""
-        super().__init__(entity_description.key, coordinator)
+        super().__init__(
+            entity_description.key,
+            coordinator,
+            frozenset(("system.info", "update.status")),
+        )
         self.entity_description = entity_description
+        self._progress_version = -1
+        self._progress: dict | None = None
 
     @property
     def installed_version(self) -> str | None:
         """Return the latest version available."""
-        if self.coordinator.data is None:
-            return None
-        return property_from_path(
-            self.coordinator.data,
-            "system.info:version",
-        )
+        return property_from_path(self._data, _INSTALLED_VERSION_PATH)
 
     @property
     def latest_version(self) -> str | None:
         """Return the latest version available, default to the installed version if none returned."""
-        if self.coordinator.data is None:
-            return None
         return (
-            property_from_path(
-                self.coordinator.data,
-                "update.status:status:new_version:version",
-            )
+            property_from_path(self._data, _LATEST_VERSION_PATH)
             or self.installed_version
         )
 
     @property
     def release_url(self) -> str | None:
         """Return the release notes of the latest version."""
-        if self.coordinator.data is None:
-            return None
-        return property_from_path(
-            self.coordinator.data,
-            "update.status:status:new_version:release_notes_url",
-        )
+        return property_from_path(self._data, _RELEASE_URL_PATH)
+
+    def _download_progress(self) -> dict | None:
+        """Return the update download progress, walked once per data update."""
+        if self._progress_version != self.coordinator.data_version:
+            self._progress = property_from_path(self._data, _PROGRESS_PATH)
+            self._progress_version = self.coordinator.data_version
+        return self._progress
 
     @property
     def in_progress(self) -> bool | None:
         """Return whether update is in progress."""
-        if self.coordinator.data is None:
-            return None
-        return (
-            property_from_path(
-                self.coordinator.data,
-                "update.status:update_download_progress",
-            )
-            is not None
-        )
+        return self._download_progress() is not None
 
     @property
     def update_percentage(self) -> float | None:
         """Return percentage of update in progress."""
-        if self.coordinator.data is None:
-            return None
-        return property_from_path(
-            self.coordinator.data,
-            "update.status:update_download_progress:percent",
-        )
+        progress = self._download_progress()
+        return progress.get("percent") if isinstance(progress, dict) else None
 
     @property
     def entity_picture(self) -> str:
@@ -2,18 +2,25 @@
 
 import asyncio
 import contextlib
-import json
 import logging
 from collections.abc import Awaitable, Callable
 
 import aiohttp
+import orjson
 
 _LOGGER = logging.getLogger(__name__)
 
+# message types compared for every frame received
+_WS_TEXT = aiohttp.WSMsgType.TEXT
+_WS_ERROR = aiohttp.WSMsgType.ERROR
+_WS_CLOSED = aiohttp.WSMsgType.CLOSED
+
 
 class WebSocketClient:
     """WebSocket client for maintaining connection and handling messages."""
 
+    _BACKOFF_STEPS = 64
+
     def __init__(
         self,
         address: str,
@@ -22,6 +29,7 @@ class WebSocketClient:
         initial_retry_delay: float = 1.0,
         max_retry_delay: float = 60.0,
         backoff_factor: float = 2.0,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         """
         Initialize the WebSocketClient with the target URL.
@@ -33,36 +41,50 @@ class WebSocketClient:
             initial_retry_delay (float, optional): Initial delay before retrying a failed connection (in seconds).
             max_retry_delay (float, optional): Maximum delay between reconnection attempts (in seconds).
             backoff_factor (float, optional): Factor by which the retry delay increases after each failure.
+            session (aiohttp.ClientSession | None, optional): A shared session to connect with, left open on close (None to create one).
 
         """
         self.url = f"wss://{address}/api/current"
         self.apikey = apikey
-
-        self.session = None
+        self._login_request = {
+            "jsonrpc": "2.0",
+            "id": None,
+            "method": "auth.login_with_api_key",
+            "params": [apikey],
+        }
+
+        self.session = session
+        # only a session created by this client is closed by it
+        self._owns_session = session is None
         self.ws = None
 
         self._connection_task = None
 
-        self._message_handlers: list[
-            Callable[[int | str, dict, bool], Awaitable[None]]
-        ] = []
-        self._connection_handlers: list[
-            Callable[[bool, str | None], Awaitable[None]]
-        ] = []
+        # tuples, as they are iterated for every message but rarely added to
+        self._message_handlers: tuple[
+            Callable[[int | str, dict, bool], Awaitable[None]], ...
+        ] = ()
+        self._connection_handlers: tuple[
+            Callable[[bool, str | None], Awaitable[None]], ...
+        ] = ()
+        self._event_handlers: tuple[
+            Callable[[str, dict | None], Awaitable[None]], ...
+        ] = ()
 
         self._should_reconnect = True
-        self._is_connected = False
+        # kept up to date at every connect and disconnect, so it is a plain attribute
+        self.is_connected = False
 
         self.max_retries = max_retries
         self.initial_retry_delay = initial_retry_delay
         self.max_retry_delay = max_retry_delay
         self.backoff_factor = backoff_factor
         self._retry_count = 0
-
-    @property
-    def is_connected(self) -> bool:
-        """Check if WebSocket is currently connected."""
-        return self._is_connected and self.ws is not None and not self.ws.closed
+        # the backoff sequence is fixed, so work it out once; the last entry repeats
+        self._retry_delays = tuple(
+            min(initial_retry_delay * (backoff_factor**attempt), max_retry_delay)
+            for attempt in range(self._BACKOFF_STEPS)
+        )
 
     async def connect(self) -> None:
         """Establish WebSocket connection with retry logic."""
@@ -107,7 +129,7 @@ class WebSocketClient:
                 )
 
                 _LOGGER.info("WebSocket connected successfully")
-                self._is_connected = True
+                self.is_connected = True
                 self._retry_count = 0  # Reset retry count on successful connection
 
                 # Notify connection handlers
@@ -117,48 +139,35 @@ class WebSocketClient:
                 await self._listen()
 
                 # Connection closed, mark as disconnected
-                self._is_connected = False
+                self.is_connected = False
                 await self._notify_connection_handlers(False, "Connection closed")
 
-            except (TimeoutError, aiohttp.ClientError, OSError) as e:
-                _LOGGER.warning("Connection failed: %s", e)
-                self._is_connected = False
-                await self._notify_connection_handlers(False, str(e))
-
-                if self._should_reconnect:
-                    # Calculate delay with exponential backoff
-                    delay = min(
-                        self.initial_retry_delay
-                        * (self.backoff_factor**self._retry_count),
-                        self.max_retry_delay,
-                    )
-
-                    _LOGGER.info("Reconnecting in %.1f seconds...", delay)
-                    self._retry_count += 1
-
-                    try:
-                        await asyncio.sleep(delay)
-                    except asyncio.CancelledError:
-                        _LOGGER.info("Reconnection cancelled")
-                        return
-                else:
-                    return
-
             except asyncio.CancelledError:
                 _LOGGER.info("Connection task cancelled")
-                self._is_connected = False
-                return
+                self.is_connected = False
+                raise
 
             except Exception as e:
-                _LOGGER.exception("Unexpected error during connection")
-                self._is_connected = False
+                self.is_connected = False
+                if isinstance(e, (TimeoutError, aiohttp.ClientError, OSError)):
+                    _LOGGER.warning("Connection failed: %s", e)
+                    # Look up the delay for this attempt from the exponential backoff
+                    delay = self._retry_delays[
+                        min(self._retry_count, self._BACKOFF_STEPS - 1)
+                    ]
+                    self._retry_count += 1
+                else:
+                    _LOGGER.exception("Unexpected error during connection")
+                    delay = self.initial_retry_delay
                 await self._notify_connection_handlers(False, str(e))
 
-                if self._should_reconnect:
-                    await asyncio.sleep(self.initial_retry_delay)
-                else:
+                if not self._should_reconnect:
                     return
 
+                # a cancel while waiting propagates, the same as during a connection
+                _LOGGER.info("Reconnecting in %.1f seconds...", delay)
+                await asyncio.sleep(delay)
+
     async def _listen(self) -> None:
         """Listen for incoming messages continuously."""
         try:
@@ -167,43 +176,24 @@ class WebSocketClient:
                 return
 
             async for msg in self.ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
+                msg_type = msg.type
+                if msg_type == _WS_TEXT:
                     try:
-                        data = json.loads(msg.data)
-                        _LOGGER.debug("Received: %s", data)
-                        msg_id = data.get("id")
-                        result = data.get("result")
-                        error = data.get("error")
-
-                        if (msg_id is None) or (result is None and error is None):
-                            _LOGGER.error("Invalid payload %s", data)
-                        else:
-                            is_error: bool = error is not None
-                            payload = error if is_error else result
-
-                            # Call all registered handlers
-                            for handler in self._message_handlers:
-                                try:
-                                    await handler(msg_id, payload, is_error)
-                                except Exception:
-                                    _LOGGER.exception("Handler error")
-                    except json.JSONDecodeError:
+                        data = orjson.loads(msg.data)
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug("Received: %s", data)
+                        await self._dispatch(data)
+                    except orjson.JSONDecodeError:
                         _LOGGER.exception("Failed to decode JSON")
 
-                elif msg.type == aiohttp.WSMsgType.ERROR:
+                elif msg_type == _WS_ERROR:
                     _LOGGER.error("WebSocket error: %s", self.ws.exception())
                     break
 
-                elif msg.type == aiohttp.WSMsgType.CLOSED:
+                elif msg_type == _WS_CLOSED:
                     _LOGGER.info("WebSocket closed by server")
                     break
 
-                elif msg.type == aiohttp.WSMsgType.PING:
-                    _LOGGER.debug("Received ping")
-
-                elif msg.type == aiohttp.WSMsgType.PONG:
-                    _LOGGER.debug("Received pong")
-
         except asyncio.CancelledError:
             _LOGGER.debug("Listen task cancelled")
             raise
@@ -213,18 +203,57 @@ class WebSocketClient:
         except Exception:
             _LOGGER.exception("Listen error")
         finally:
-            self._is_connected = False
+            self.is_connected = False
             _LOGGER.info("Listen loop ended, connection lost")
 
+    async def _dispatch(self, data: dict) -> None:
+        """Pass a decoded message to the handlers registered for its kind."""
+        msg_id = data.get("id")
+        if msg_id is None:
+            if "method" in data:
+                # notification, e.g. an event from a subscription
+                for handler in self._event_handlers:
+                    try:
+                        await handler(data["method"], data.get("params"))
+                    except Exception:
+                        _LOGGER.exception("Event handler error")
+            else:
+                _LOGGER.error("Invalid payload %s", data)
+            return
+
+        # a response holds exactly one of these, most often result
+        if (result := data.get("result")) is not None:
+            is_error = False
+            payload = result
+        elif (error := data.get("error")) is not None:
+            is_error = True
+            payload = error
+        else:
+            _LOGGER.error("Invalid payload %s", data)
+            return
+
+        # Call all registered handlers
+        for handler in self._message_handlers:
+            try:
+                await handler(msg_id, payload, is_error)
+            except Exception:
+                _LOGGER.exception("Handler error")
+
     async def send_message(self, msg_id: int | str, method: str, params: list) -> None:
         """Send JSON message to WebSocket."""
-        if self.ws is None or self.ws.closed:
+        data = {"jsonrpc": "2.0", "id": msg_id, "method": method, "params": params}
+        await self._send(data)
+
+    async def _send(self, data: dict) -> None:
+        """Encode and send a request that has been fully built."""
+        if not self.is_connected:
             msg = "WebSocket not connected"
             raise ConnectionError(msg)
 
-        data = {"jsonrpc": "2.0", "id": msg_id, "method": method, "params": params}
-        await self.ws.send_json(data)
-        _LOGGER.debug("Sent: %s", data)
+        # the server expects text frames, so send the encoded bytes as a string
+        await self.ws.send_str(orjson.dumps(data).decode())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sent: %s", data)
 
     async def send_login(self, msg_id: int | str) -> None:
         """
@@ -234,7 +263,9 @@ class WebSocketClient:
             msg_id (int | str): The message ID to use for the login request.
 
         """
-        await self.send_message(msg_id, "auth.login_with_api_key", [self.apikey])
+        # only the id changes between logins, and it is encoded before any await
+        self._login_request["id"] = msg_id
+        await self._send(self._login_request)
 
     def add_message_handler(
         self, handler: Callable[[int | str, dict, bool], Awaitable[None]]
@@ -244,7 +275,7 @@ class WebSocketClient:
 
         The handler receives: (msg_id: int | str, payload: dict, is_error: bool)
         """
-        self._message_handlers.append(handler)
+        self._message_handlers = (*self._message_handlers, handler)
 
     def add_connection_handler(
         self, handler: Callable[[bool, str | None], Awaitable[None]]
@@ -254,7 +285,17 @@ class WebSocketClient:
 
         Handler receives: (is_connected: bool, error: Optional[str])
         """
-        self._connection_handlers.append(handler)
+        self._connection_handlers = (*self._connection_handlers, handler)
+
+    def add_event_handler(
+        self, handler: Callable[[str, dict | None], Awaitable[None]]
+    ) -> None:
+        """
+        Register a callback for handling notifications, such as subscribed events.
+
+        The handler receives: (method: str, params: dict | None)
+        """
+        self._event_handlers = (*self._event_handlers, handler)
 
     async def _notify_connection_handlers(
         self,
@@ -262,11 +303,14 @@ class WebSocketClient:
         error: str | None,
     ) -> None:
         """Notify all connection handlers of state change."""
-        for handler in self._connection_handlers:
-            try:
-                await handler(is_connected, error)
-            except Exception:
-                _LOGGER.exception("Connection handler error")
+        # handlers are independent, so a slow one should not hold up the rest
+        results = await asyncio.gather(
+            *(handler(is_connected, error) for handler in self._connection_handlers),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error("Connection handler error", exc_info=result)
 
     async def close(self) -> None:
         """Close WebSocket connection and cleanup."""
@@ -284,10 +328,11 @@ class WebSocketClient:
             await self.ws.close()
 
         # Close session
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
 
-        self._is_connected = False
+        self.is_connected = False
         _LOGGER.info("WebSocket client closed")
 
     async def force_reconnect(self) -> None: